@@ -1,5 +1,7 @@
 """Resume parser framework for extracting structured information from resumes."""
 
+from typing import TYPE_CHECKING, Any
+
 from .extractors import (
     EmailExtractor,
     ExtractorConfig,
@@ -8,15 +10,19 @@ from .extractors import (
     SkillsExtractor,
 )
 from .framework import ResumeParserFramework
-from .models import ResumeData
-from .parsers import FileParser, ParserFactory, PDFParser, WordParser
+from .models import ResumeBatch, ResumeData
+from .parsers import FileParser, ParserFactory
 from .resume_extractor import ResumeExtractor
 
+if TYPE_CHECKING:
+    from .parsers import PDFParser, WordParser
+
 __version__ = "1.0.0"
 
 __all__ = [
     # Models
     "ResumeData",
+    "ResumeBatch",
     # Parsers
     "FileParser",
     "PDFParser",
@@ -33,3 +39,15 @@ __all__ = [
     # Framework
     "ResumeParserFramework",
 ]
+
+# Concrete parser classes stay lazy (see resume_parser.parsers) so their
+# document libraries load only when a parser is actually used.
+_LAZY_CLASSES = ("PDFParser", "WordParser")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_CLASSES:
+        from . import parsers
+
+        return getattr(parsers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,16 @@
 """Extractors package for field-specific extraction strategies."""
 
-from .base import FieldExtractor
-from .config import ExtractorConfig
+from .base import FieldExtractor, ResumeBuffers
+from .config import ExtractorConfig, get_extractor_config
 from .email_extractor import EmailExtractor
 from .name_extractor import NameExtractor
 from .skills_extractor import SkillsExtractor
 
 __all__ = [
     "FieldExtractor",
+    "ResumeBuffers",
     "ExtractorConfig",
+    "get_extractor_config",
     "EmailExtractor",
     "NameExtractor",
     "SkillsExtractor",
@@ -1,9 +1,34 @@
 """Base classes for field extractors."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any
 
 
+@dataclass(slots=True, frozen=True)
+class ResumeBuffers:
+    """Precomputed views of one resume's text, shared across extractors.
+
+    Each extractor used to re-derive these forms independently, re-walking
+    the same 10-100 KB of text several times per resume. The coordinator
+    builds them once so every extractor reads the same buffers.
+
+    Attributes:
+        text: Full raw text content from the resume
+        text_lower: Case-folded copy of ``text`` for case-insensitive scans
+        header: First 500 characters of ``text``, where the name lives
+    """
+
+    text: str
+    text_lower: str
+    header: str
+
+    @classmethod
+    def from_text(cls, text: str) -> "ResumeBuffers":
+        """Build all views of a resume text in one place."""
+        return cls(text=text, text_lower=text.lower(), header=text[:500])
+
+
 class FieldExtractor(ABC):
     """Abstract base class for field extractors.
 
@@ -26,3 +51,12 @@ class FieldExtractor(ABC):
             ValueError: If extraction fails or text is invalid
         """
         pass
+
+    def extract_from(self, buffers: ResumeBuffers) -> Any:
+        """Extract a field from prebuilt resume buffers.
+
+        Subclasses override this when they can reuse a precomputed view
+        (e.g. the case-folded text) instead of re-deriving it; the
+        default simply delegates to :meth:`extract`.
+        """
+        return self.extract(buffers.text)
@@ -1,6 +1,7 @@
 """Configuration for field extractors."""
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import Field, field_validator
@@ -37,6 +38,7 @@ class ExtractorConfig(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # Email extractor settings
@@ -62,6 +64,11 @@ class ExtractorConfig(BaseSettings):
         description="Gemini model name to use for skills extraction",
     )
 
+    skills_batch_size: int = Field(
+        default=8,
+        description="Number of resumes grouped into one prompt for batched skills extraction",
+    )
+
     use_skills_fallback: bool = Field(
         default=True,
         description="Whether to use keyword fallback if LLM extraction fails",
@@ -78,3 +85,15 @@ class ExtractorConfig(BaseSettings):
                 "or pass gemini_api_key to enable LLM-based extraction."
             )
         return v
+
+
+@lru_cache(maxsize=1)
+def get_extractor_config() -> ExtractorConfig:
+    """Return the process-wide default configuration.
+
+    Building ExtractorConfig re-reads .env, validates, and re-warns on
+    every call; short-lived invocations pay that on each framework
+    construction. The instance is frozen, so sharing it across threads
+    is safe.
+    """
+    return ExtractorConfig()
@@ -4,15 +4,44 @@ import re
 
 from .base import FieldExtractor
 
+try:  # Optional linear-time DFA backend (google-re2); stdlib re is the default.
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+_EMAIL_PATTERN = r"\b[A-Za-z0-9._%+\-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"
+
+# Compiled once at import time. re.ASCII keeps the character classes on the
+# byte-oriented matching path instead of full Unicode property lookups; re2
+# compiles the same pattern to a DFA and guarantees linear-time scanning.
+if _re2 is not None:
+    _EMAIL_RE = _re2.compile(_EMAIL_PATTERN)
+else:
+    _EMAIL_RE = re.compile(_EMAIL_PATTERN, re.ASCII)
+
 
 class EmailExtractor(FieldExtractor):
     """Extract email address from resume text."""
 
     def extract(self, text: str) -> str:
-        """Extract email using regex."""
+        """Extract the first email address found in the text."""
         if not text.strip():
             return ""
 
-        pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        match = re.search(pattern, text)
+        # str.find is a memchr-backed C scan; it rules out @-free text
+        # without ever entering the regex engine, and otherwise narrows
+        # the scan to start just before the first '@' (RFC 5321 caps the
+        # local part at 64 chars).
+        at = text.find("@")
+        if at < 0:
+            return ""
+
+        match = _EMAIL_RE.search(text, max(0, at - 64))
         return match.group(0) if match else ""
+
+    def extract_all(self, text: str) -> list[str]:
+        """Extract all email addresses found in the text."""
+        if not text.strip() or "@" not in text:
+            return []
+
+        return [match.group(0) for match in _EMAIL_RE.finditer(text)]
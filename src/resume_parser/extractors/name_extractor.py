@@ -1,10 +1,38 @@
 """Name extractor using simple pattern matching."""
 
 import re
+from functools import lru_cache
+from typing import Any
 
 import spacy
 
-from .base import FieldExtractor
+from .base import FieldExtractor, ResumeBuffers
+
+
+@lru_cache(maxsize=4)
+def _load_spacy(model_name: str) -> Any:
+    """Load a spaCy model once per process, keeping only the NER component.
+
+    Model loading costs seconds and hundreds of MB, so repeated
+    NameExtractor construction must not pay it again. Only ``ner`` (and
+    its ``tok2vec`` listener) is used here, so the rest of the pipeline
+    is disabled at load time.
+    """
+    return spacy.load(
+        model_name,
+        disable=["tagger", "parser", "attribute_ruler", "lemmatizer"],
+    )
+
+
+# Two or more capitalized words, e.g. "John Doe". Compiled once at import
+# time with re.ASCII so the character classes stay on the byte-oriented
+# matching path; the input is a single short line.
+_NAME_RE = re.compile(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$", re.ASCII)
+
+
+def _looks_like_name(line: str) -> bool:
+    """Check whether a stripped line looks like a candidate name."""
+    return _NAME_RE.match(line) is not None
 
 
 class NameExtractor(FieldExtractor):
@@ -12,32 +40,102 @@ class NameExtractor(FieldExtractor):
 
     def __init__(self, model_name: str = "en_core_web_sm") -> None:
         """Initialize with spaCy model."""
-        self.nlp = spacy.load(model_name)
+        self.nlp = _load_spacy(model_name)
+        # Components needed for entity recognition, called directly in
+        # extract() to skip per-call pipeline dispatch. tok2vec must run
+        # first: ner listens to its output.
+        self._ner_components = tuple(
+            self.nlp.get_pipe(name) for name in ("tok2vec", "ner") if name in self.nlp.pipe_names
+        )
 
     def extract(self, text: str) -> str:
         """Extract name from resume text."""
         if not text.strip():
             return ""
 
-        # Try first line
+        name = self._extract_from_first_line(text)
+        if name:
+            return name
+
+        # Fallback to NER: tokenize once, then run only the entity
+        # components instead of dispatching through the full pipeline.
+        window = self._ner_window(text)
+        if self._ner_components:
+            doc = self.nlp.make_doc(window)
+            for component in self._ner_components:
+                doc = component(doc)
+        else:
+            doc = self.nlp(window)
+        return self._first_person(doc)
+
+    def extract_from(self, buffers: ResumeBuffers) -> str:
+        """Extract the name from the precomputed header window.
+
+        The name check and the NER fallback only ever look at the first
+        500 characters, so the full text is never touched.
+        """
+        return self.extract(buffers.header)
+
+    def extract_many(self, texts: list[str]) -> list[str]:
+        """Extract names from several resume texts in one pass.
+
+        The cheap first-line check runs per text; only texts that fail it
+        are batched through ``nlp.pipe``, which amortizes spaCy's
+        per-call overhead across the batch.
+        """
+        results = ["" for _ in texts]
+        pending: list[int] = []
+        for i, text in enumerate(texts):
+            if not text.strip():
+                continue
+            name = self._extract_from_first_line(text)
+            if name:
+                results[i] = name
+            else:
+                pending.append(i)
+
+        if pending:
+            windows = (self._ner_window(texts[i]) for i in pending)
+            for i, doc in zip(pending, self.nlp.pipe(windows, batch_size=32), strict=True):
+                results[i] = self._first_person(doc)
+
+        return results
+
+    def _extract_from_first_line(self, text: str) -> str:
+        """Return the first line if it looks like a name, else ''."""
         lines = [line.strip() for line in text.split("\n") if line.strip()]
-        if lines:
-            first_line = lines[0]
-            # Handle titles (e.g., "John Doe - Software Engineer")
-            for sep in [" - ", " | ", " — "]:
-                if sep in first_line:
-                    first_line = first_line.split(sep)[0].strip()
-
-            # Check if it looks like a name
-            name_pattern = r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$"
-            if re.match(name_pattern, first_line):
-                return first_line
-
-        # Fallback to NER
-        doc = self.nlp(text[:500])
+        if not lines:
+            return ""
+
+        first_line = lines[0]
+        # Handle titles (e.g., "John Doe - Software Engineer")
+        for sep in [" - ", " | ", " — "]:
+            if sep in first_line:
+                first_line = first_line.split(sep)[0].strip()
+
+        # Check if it looks like a name
+        if _looks_like_name(first_line):
+            return first_line
+        return ""
+
+    @staticmethod
+    def _ner_window(text: str) -> str:
+        """Slice the header window handed to NER.
+
+        The name is nearly always in the first couple of lines, so shrink
+        the window to 200 chars when it already spans several lines; keep
+        the full 500 for long unbroken headers.
+        """
+        window = text[:500]
+        if window.count("\n") >= 2:
+            window = window[:200]
+        return window
+
+    @staticmethod
+    def _first_person(doc: Any) -> str:
+        """Return the first PERSON entity in a processed doc, else ''."""
         for ent in doc.ents:
             if ent.label_ == "PERSON":
                 name: str = ent.text.strip()
                 return name
-
         return ""
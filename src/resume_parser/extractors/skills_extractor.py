@@ -1,53 +1,298 @@
 """Skills extractor using Google Gemini LLM."""
 
-import json
+import asyncio
+import hashlib
+import re
+import threading
 from typing import Any, Optional
 
+import ahocorasick
 import google.generativeai as genai
 
-from .base import FieldExtractor
+from ..json_fast import loads as _loads
+from .base import FieldExtractor, ResumeBuffers
+
+# Common technical skills, used both to prefilter prompt text and as the
+# keyword-fallback lexicon. Matching is case-insensitive; these are the
+# canonical forms returned to callers.
+COMMON_SKILLS = (
+    "Python",
+    "Java",
+    "JavaScript",
+    "TypeScript",
+    "C++",
+    "C#",
+    "Go",
+    "Rust",
+    "SQL",
+    "HTML",
+    "CSS",
+    "React",
+    "Angular",
+    "Vue",
+    "Node",
+    "Django",
+    "Flask",
+    "Spring",
+    "Docker",
+    "Kubernetes",
+    "AWS",
+    "Azure",
+    "GCP",
+    "Terraform",
+    "Git",
+    "Linux",
+    "Machine Learning",
+    "Deep Learning",
+    "TensorFlow",
+    "PyTorch",
+    "Pandas",
+    "NumPy",
+)
+
+# Lowercased lexicon tokens for case-insensitive matching.
+_SKILL_TOKENS = tuple(skill.lower() for skill in COMMON_SKILLS)
+
+
+def _build_automaton() -> ahocorasick.Automaton:
+    """Build the keyword automaton once at import time.
+
+    Aho-Corasick matches every lexicon entry in a single O(len(text))
+    pass instead of one substring scan per skill.
+    """
+    automaton = ahocorasick.Automaton()
+    for token, skill in zip(_SKILL_TOKENS, COMMON_SKILLS, strict=True):
+        automaton.add_word(token, skill)
+    automaton.make_automaton()
+    return automaton
+
+
+_SKILL_AUTOMATON = _build_automaton()
+
+
+def _is_standalone(text: str, start: int, end: int) -> bool:
+    """Check that a match is not embedded in a longer word.
+
+    Only edges that are alphanumeric need fencing, so 'java' does not
+    fire inside 'javascript' while 'c++' may butt against anything.
+    """
+    if text[start].isalnum() and start > 0 and text[start - 1].isalnum():
+        return False
+    if text[end].isalnum() and end + 1 < len(text) and text[end + 1].isalnum():
+        return False
+    return True
+
+
+# Static part of every skills prompt. Passing it as a system instruction
+# lets the API cache it across calls instead of re-billing it per request.
+_SYSTEM_INSTRUCTION = (
+    "You extract technical skills from resume text. "
+    "Respond with JSON only — no prose, no markdown fencing."
+)
+
+# Response schema for single-resume calls: constrain the model to emit a
+# bare JSON array of strings.
+_ARRAY_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {"type": "ARRAY", "items": {"type": "STRING"}},
+}
+
+# camelCase / mixed-case tech names (e.g. PyTorch, JavaScript) that the
+# lexicon may miss.
+_CAMEL_CASE_RE = re.compile(r"[a-z][A-Z]", re.ASCII)
+
+
+def _prefilter_lines(text: str) -> str:
+    """Keep only lines likely to mention skills.
+
+    A line survives when its lowercase form contains a lexicon token or
+    it contains a camelCase word. This typically shrinks the prompt
+    several-fold while retaining skill mentions; when nothing survives,
+    the original window is sent unchanged.
+
+    The window is case-folded once up front; folding per line would
+    re-pay the allocation for every line.
+    """
+    kept = [
+        line
+        for line, lower in zip(text.splitlines(), text.lower().splitlines(), strict=True)
+        if lower and (any(token in lower for token in _SKILL_TOKENS) or _CAMEL_CASE_RE.search(line))
+    ]
+    return "\n".join(kept) if kept else text
+
+
+# Configured GenerativeModel instances, shared across extractor instances.
+# Keyed by (api-key digest, model name) so a rotated key builds a fresh
+# client; the digest keeps raw keys out of the registry.
+_GEMINI_MODELS: dict[tuple[str, str], Any] = {}
+_GEMINI_LOCK = threading.Lock()
+
+
+def _get_gemini_model(api_key: str, model_name: str) -> Any:
+    """Return a configured GenerativeModel, building it at most once."""
+    key = (hashlib.sha256(api_key.encode()).hexdigest(), model_name)
+    with _GEMINI_LOCK:
+        model = _GEMINI_MODELS.get(key)
+        if model is None:
+            genai.configure(api_key=api_key)  # type: ignore[attr-defined]
+            model = genai.GenerativeModel(  # type: ignore[attr-defined]
+                model_name,
+                system_instruction=_SYSTEM_INSTRUCTION,
+                generation_config={"response_mime_type": "application/json"},
+            )
+            _GEMINI_MODELS[key] = model
+        return model
 
 
 class SkillsExtractor(FieldExtractor):
     """Extract technical skills using Google Gemini."""
 
-    def __init__(self, api_key: Optional[str] = None, model_name: str = "gemini-2.0-flash") -> None:
-        """Initialize with Gemini API key and model name."""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model_name: str = "gemini-2.0-flash",
+        batch_size: int = 8,
+        max_concurrency: int = 8,
+        use_fallback: bool = True,
+    ) -> None:
+        """Initialize with Gemini API key, model name, and batch size."""
+        self.batch_size = batch_size
+        self.use_fallback = use_fallback
+        self._semaphore = asyncio.Semaphore(max_concurrency)
         self.model: Optional[Any] = None
         if api_key:
             try:
-                genai.configure(api_key=api_key)  # type: ignore[attr-defined]
-                self.model = genai.GenerativeModel(model_name)  # type: ignore[attr-defined]
+                self.model = _get_gemini_model(api_key, model_name)
             except Exception:
                 pass
 
     def extract(self, text: str) -> list[str]:
         """Extract skills from resume text."""
+        return self._extract(text, None)
+
+    def extract_from(self, buffers: ResumeBuffers) -> list[str]:
+        """Extract skills, reusing the coordinator's case-folded text."""
+        return self._extract(buffers.text, buffers.text_lower)
+
+    def _extract(self, text: str, text_lower: Optional[str]) -> list[str]:
+        """Extract skills, optionally reusing a precomputed folded copy."""
         if not text.strip():
             return []
 
         if self.model:
             try:
-                prompt = f"""Extract all technical skills from this resume.
-Return ONLY a JSON array of skills like: ["Python", "Docker", "AWS"]
+                response = self.model.generate_content(
+                    self._build_prompt(text), generation_config=_ARRAY_CONFIG
+                )
+                skills = _loads(response.text)
+                return self._clean_skills(skills)
+            except Exception:
+                pass
 
-Resume: {text[:2000]}
+        # Fallback: keyword scan (or nothing when disabled)
+        if self.use_fallback:
+            return self._extract_with_keywords(text, text_lower)
+        return []
 
-Skills:"""
-                response = self.model.generate_content(prompt)
-                response_text = response.text.strip()
+    async def extract_async(self, text: str) -> list[str]:
+        """Extract skills without blocking the event loop.
 
-                # Remove markdown if present
-                if response_text.startswith("```"):
-                    response_text = response_text.split("```")[1]
-                    if response_text.startswith("json"):
-                        response_text = response_text[4:]
+        Concurrent calls share a semaphore so a large gather() fans out
+        requests up to ``max_concurrency`` at a time instead of flooding
+        the API.
+        """
+        if not text.strip():
+            return []
 
-                skills = json.loads(response_text)
-                if isinstance(skills, list):
-                    return [s.strip() for s in skills if isinstance(s, str) and s.strip()]
+        if self.model:
+            try:
+                async with self._semaphore:
+                    response = await self.model.generate_content_async(
+                        self._build_prompt(text), generation_config=_ARRAY_CONFIG
+                    )
+                skills = _loads(response.text)
+                return self._clean_skills(skills)
             except Exception:
                 pass
 
-        # Fallback: return empty list
+        if self.use_fallback:
+            return self._extract_with_keywords(text)
+        return []
+
+    def extract_batch(self, texts: list[str]) -> list[list[str]]:
+        """Extract skills from several resume texts.
+
+        Groups up to ``batch_size`` resumes into one prompt so a batch
+        pays one network round-trip instead of one per resume. Groups
+        whose combined response cannot be parsed fall back to per-resume
+        extraction.
+        """
+        if not self.model:
+            if self.use_fallback:
+                return [self._extract_with_keywords(text) for text in texts]
+            return [[] for _ in texts]
+
+        results: list[list[str]] = []
+        for start in range(0, len(texts), self.batch_size):
+            group = texts[start : start + self.batch_size]
+            results.extend(self._extract_group(group))
+        return results
+
+    # ResumeExtractor.extract_batch dispatches whole columns through
+    # extract_many; alias it so the grouped-prompt path is picked up
+    # instead of one blocking request per resume.
+    extract_many = extract_batch
+
+    def _extract_group(self, group: list[str]) -> list[list[str]]:
+        """Extract skills for one group of resumes with a single request."""
+        sections = "\n\n".join(
+            f"--- resume_{i} ---\n{_prefilter_lines(text[:2000])}" for i, text in enumerate(group)
+        )
+        prompt = f"""Return a JSON object mapping each resume id to a JSON array of its
+skills, like: {{"resume_0": ["Python", "Docker"], "resume_1": ["AWS"]}}
+
+{sections}"""
+        try:
+            response = self.model.generate_content(prompt)  # type: ignore[union-attr]
+            parsed = _loads(response.text)
+            if isinstance(parsed, dict):
+                return [self._clean_skills(parsed.get(f"resume_{i}")) for i in range(len(group))]
+        except Exception:
+            pass
+
+        # Fall back to one request per resume in this group
+        return [self.extract(text) for text in group]
+
+    @staticmethod
+    def _extract_with_keywords(text: str, text_lower: Optional[str] = None) -> list[str]:
+        """Extract skills by scanning for the COMMON_SKILLS lexicon.
+
+        One automaton pass over the lowercased text replaces a substring
+        scan per lexicon entry. A caller holding a case-folded copy can
+        pass it in to skip re-folding.
+        """
+        if not text.strip():
+            return []
+
+        if text_lower is None:
+            text_lower = text.lower()
+        found = set()
+        for end, skill in _SKILL_AUTOMATON.iter(text_lower):
+            if _is_standalone(text_lower, end - len(skill) + 1, end):
+                found.add(skill)
+        return sorted(found)
+
+    @staticmethod
+    def _build_prompt(text: str) -> str:
+        """Build the per-resume prompt from a prefiltered text window."""
+        return (
+            'Return a JSON array of skills like: ["Python", "Docker", "AWS"]\n\n'
+            f"Resume: {_prefilter_lines(text[:2000])}"
+        )
+
+    @staticmethod
+    def _clean_skills(skills: Any) -> list[str]:
+        """Normalize a parsed skills payload into a list of strings."""
+        if isinstance(skills, list):
+            return [s.strip() for s in skills if isinstance(s, str) and s.strip()]
         return []
@@ -1,6 +1,14 @@
 """Main framework for parsing resumes."""
 
-from .extractors import EmailExtractor, ExtractorConfig, NameExtractor, SkillsExtractor
+import asyncio
+
+from .extractors import (
+    EmailExtractor,
+    ExtractorConfig,
+    NameExtractor,
+    SkillsExtractor,
+    get_extractor_config,
+)
 from .models import ResumeData
 from .parsers import ParserFactory
 from .resume_extractor import ResumeExtractor
@@ -11,7 +19,7 @@ class ResumeParserFramework:
 
     def __init__(self, config: ExtractorConfig | None = None) -> None:
         """Initialize with optional configuration."""
-        self.config = config or ExtractorConfig()
+        self.config = config or get_extractor_config()
         self.parser_factory = ParserFactory()
         self.extractor = ResumeExtractor(
             {
@@ -20,6 +28,8 @@ class ResumeParserFramework:
                 "skills": SkillsExtractor(
                     api_key=self.config.gemini_api_key,
                     model_name=self.config.gemini_model,
+                    batch_size=self.config.skills_batch_size,
+                    use_fallback=self.config.use_skills_fallback,
                 ),
             }
         )
@@ -27,5 +37,19 @@ class ResumeParserFramework:
     def parse_resume(self, file_path: str) -> ResumeData:
         """Parse a resume file and extract structured data."""
         parser = self.parser_factory.get_parser(file_path)
-        text = parser.parse(file_path)
+        text = parser.parse_cached(file_path)
         return self.extractor.extract(text)
+
+    async def parse_resume_async(self, file_path: str) -> ResumeData:
+        """Parse a resume file without blocking the event loop."""
+        parser = self.parser_factory.get_parser(file_path)
+        text = await asyncio.to_thread(parser.parse_cached, file_path)
+        return await self.extractor.extract_async(text)
+
+    async def parse_many_async(self, file_paths: list[str]) -> list[ResumeData]:
+        """Parse several resumes concurrently.
+
+        LLM latency overlaps across resumes, so wall time approaches the
+        slowest single resume instead of the sum of all of them.
+        """
+        return list(await asyncio.gather(*(self.parse_resume_async(path) for path in file_paths)))
@@ -0,0 +1,14 @@
+"""Fastest available JSON deserializer, resolved once at import.
+
+Modules that parse JSON on a hot path import :func:`loads` from here
+instead of choosing a backend themselves, so the orjson-or-stdlib
+decision lives in one place. ``loads`` is bound directly to the backend
+function — no wrapper frame on the hot path.
+"""
+
+try:  # SIMD-accelerated JSON parsing when the wheel is installed.
+    from orjson import loads as loads
+except ImportError:
+    from json import loads as loads  # type: ignore[assignment]
+
+__all__ = ["loads"]
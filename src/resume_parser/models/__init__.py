@@ -1,5 +1,6 @@
 """Models package for resume parser."""
 
+from .resume_batch import ResumeBatch
 from .resume_data import ResumeData
 
-__all__ = ["ResumeData"]
+__all__ = ["ResumeData", "ResumeBatch"]
@@ -0,0 +1,62 @@
+"""Columnar container for batch extraction results."""
+
+from dataclasses import dataclass, field
+from typing import Iterator, List
+
+from .resume_data import ResumeData
+
+
+@dataclass(slots=True)
+class ResumeBatch:
+    """Extraction results for many resumes, stored column-wise.
+
+    Analytics over a batch usually pull a single column (all emails,
+    all skills), which against ``list[ResumeData]`` means re-walking N
+    objects per query. Parallel lists keep each column contiguous, ready
+    to hand to a dataframe constructor, and rows can still be
+    materialized individually via :meth:`row`.
+
+    Attributes:
+        names: Candidate name per resume, in input order
+        emails: Email address per resume, in input order
+        skills: Skill list per resume, in input order
+    """
+
+    names: List[str] = field(default_factory=list)
+    emails: List[str] = field(default_factory=list)
+    skills: List[List[str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Return the number of resumes in the batch."""
+        return len(self.names)
+
+    def row(self, index: int) -> ResumeData:
+        """Materialize one resume's fields as a :class:`ResumeData`.
+
+        Args:
+            index: Position of the resume in the batch
+
+        Returns:
+            ResumeData for that resume (partial fields allowed)
+        """
+        return ResumeData(
+            name=self.names[index],
+            email=self.emails[index],
+            skills=list(self.skills[index]),
+            allow_partial=True,
+        )
+
+    def __iter__(self) -> Iterator[ResumeData]:
+        """Iterate rows as :class:`ResumeData` instances."""
+        return (self.row(i) for i in range(len(self.names)))
+
+    def to_columns(self) -> dict[str, List[str] | List[List[str]]]:
+        """Return the columns as a name-to-list mapping.
+
+        The result feeds ``pandas.DataFrame`` or ``polars.DataFrame``
+        directly without per-row conversion.
+
+        Returns:
+            Mapping with name, email, and skills columns
+        """
+        return {"name": self.names, "email": self.emails, "skills": self.skills}
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class ResumeData:
     """Encapsulates extracted resume information.
 
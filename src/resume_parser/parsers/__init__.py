@@ -1,8 +1,27 @@
 """Parsers package for handling different file formats."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .base import FileParser
-from .factory import ParserFactory
-from .pdf_parser import PDFParser
-from .word_parser import WordParser
+from .factory import DEFAULT_FACTORY, ParserFactory
+
+if TYPE_CHECKING:
+    from .pdf_parser import PDFParser
+    from .word_parser import WordParser
+
+__all__ = ["FileParser", "PDFParser", "WordParser", "ParserFactory", "DEFAULT_FACTORY"]
+
+# Concrete parsers are imported on first attribute access (PEP 562) so
+# importing this package does not pull in pymupdf and python-docx/lxml.
+_LAZY_CLASSES = {
+    "PDFParser": "pdf_parser",
+    "WordParser": "word_parser",
+}
+
 
-__all__ = ["FileParser", "PDFParser", "WordParser", "ParserFactory"]
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module_name}", __name__), name)
@@ -0,0 +1,30 @@
+"""Single-pass text normalization applied to parser output."""
+
+import re
+
+# One pattern per defect class, precompiled once. Both substitutions run
+# in the regex engine's C loop, so normalization is two passes over the
+# text with no Python-level per-character work.
+#
+# Newlines are deliberately preserved: downstream extractors key off
+# line structure (the name extractor inspects the first line, the
+# skills prefilter scans per-line).
+_CONTROL_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]+")
+_TRAILING_RUN_RE = re.compile(r"[^\S\n]+(?=\n)")
+_HSPACE_RUN_RE = re.compile(r"[^\S\n]{2,}")
+
+
+def normalize(text: str) -> str:
+    """Collapse horizontal whitespace runs and strip control characters.
+
+    Args:
+        text: Raw text as produced by a document parser
+
+    Returns:
+        Text with control characters removed, runs of spaces and tabs
+        collapsed to a single space, and trailing whitespace dropped
+        from each line; newlines are untouched
+    """
+    text = _CONTROL_RE.sub("", text)
+    text = _TRAILING_RUN_RE.sub("", text)
+    return _HSPACE_RUN_RE.sub(" ", text)
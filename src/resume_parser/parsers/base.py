@@ -1,6 +1,13 @@
 """Base classes for file parsers."""
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+
+# Parsed-text cache shared by all parsers, keyed by parser type plus the
+# file's identity (path, mtime, size) so rewritten files re-parse.
+_TEXT_CACHE: "OrderedDict[tuple[str, str, int, int], str]" = OrderedDict()
+_TEXT_CACHE_MAX = 128
 
 
 class FileParser(ABC):
@@ -26,3 +33,59 @@ class FileParser(ABC):
             ValueError: If the file format is invalid or corrupted
         """
         pass
+
+    def parse_cached(self, file_path: str) -> str:
+        """Parse a file, memoizing the result by file identity.
+
+        Re-submitting an unchanged file — common in pipelines with
+        retries or extractor A/B runs — returns the cached text instead
+        of re-running the parse. The cache key includes mtime and size,
+        so a rewritten file misses and re-parses; the cache itself is
+        bounded LRU.
+
+        Args:
+            file_path: Path to the file to parse
+
+        Returns:
+            Extracted text content as a string
+
+        Raises:
+            ValueError: If the file format is invalid or corrupted
+        """
+        try:
+            stat = Path(file_path).stat()
+        except OSError:
+            # Missing file: let parse() raise its usual error
+            return self.parse(file_path)
+
+        key = (type(self).__name__, file_path, stat.st_mtime_ns, stat.st_size)
+        cached = _TEXT_CACHE.get(key)
+        if cached is not None:
+            _TEXT_CACHE.move_to_end(key)
+            return cached
+
+        text = self.parse(file_path)
+        _TEXT_CACHE[key] = text
+        if len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+            _TEXT_CACHE.popitem(last=False)
+        return text
+
+    def parse_bytes(self, data: bytes) -> str:
+        """Extract text content from an in-memory file buffer.
+
+        Parsers supporting in-memory input override this so callers can
+        separate I/O from parsing (e.g. to overlap file reads across a
+        batch). The default signals that only path-based parsing is
+        available.
+
+        Args:
+            data: Raw bytes of the file
+
+        Returns:
+            Extracted text content as a string
+
+        Raises:
+            NotImplementedError: If the parser only supports paths
+            ValueError: If the file format is invalid or corrupted
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support in-memory parsing")
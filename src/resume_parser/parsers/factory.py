@@ -1,15 +1,25 @@
 """Factory for creating file parsers based on extension."""
 
+import asyncio
+import importlib
 import logging
-from pathlib import Path
-from typing import Type
+from typing import Type, Union
+
+import aiofiles
 
 from .base import FileParser
-from .pdf_parser import PDFParser
-from .word_parser import WordParser
 
 logger = logging.getLogger(__name__)
 
+# Default parsers are registered as "module:Class" strings and imported
+# on first use, so a PDF-only workload never pays the python-docx/lxml
+# import cost (and vice versa).
+_DEFAULT_PARSERS: dict[str, str] = {
+    ".pdf": "resume_parser.parsers.pdf_parser:PDFParser",
+    ".docx": "resume_parser.parsers.word_parser:WordParser",
+    ".doc": "resume_parser.parsers.word_parser:WordParser",  # python-docx handles both
+}
+
 
 class ParserFactory:
     """Factory for creating appropriate file parsers based on file extension.
@@ -37,19 +47,44 @@ class ParserFactory:
             ValueError: If extension format is invalid
             TypeError: If parser class doesn't inherit from FileParser
         """
-        # Initialize with default parsers
-        self._parsers: dict[str, Type[FileParser]] = {
-            ".pdf": PDFParser,
-            ".docx": WordParser,
-            ".doc": WordParser,  # Support older .doc format (python-docx handles both)
-        }
+        # Initialize with default parsers (lazy import strings)
+        self._parsers: dict[str, Union[Type[FileParser], str]] = dict(_DEFAULT_PARSERS)
+
+        # Parser instances, created lazily and reused — registered
+        # parsers are stateless, so one instance per extension suffices.
+        self._instances: dict[str, FileParser] = {}
 
         # Validate and add custom parsers
         if custom_parsers:
             for extension, parser_class in custom_parsers.items():
                 self._validate_and_add_parser(extension, parser_class)
 
-        logger.info(f"ParserFactory initialized with {len(self._parsers)} parsers")
+        # %-style args defer formatting until a handler is enabled.
+        logger.info("ParserFactory initialized with %d parsers", len(self._parsers))
+
+    @classmethod
+    def from_trusted(
+        cls, custom_parsers: dict[str, Type[FileParser]] | None = None
+    ) -> "ParserFactory":
+        """Build a factory from a pre-validated registry, skipping checks.
+
+        For callers that construct a factory per request from a mapping
+        they control, the validation chain in ``__init__`` is the entire
+        construction cost. This writes the registry directly.
+
+        Args:
+            custom_parsers: Optional pre-validated extension-to-class
+                          mapping merged over the defaults
+
+        Returns:
+            A factory equivalent to ``ParserFactory(custom_parsers)``
+        """
+        factory = cls.__new__(cls)
+        factory._parsers = dict(_DEFAULT_PARSERS)
+        if custom_parsers:
+            factory._parsers.update(custom_parsers)
+        factory._instances = {}
+        return factory
 
     def _validate_and_add_parser(self, extension: str, parser_class: Type[FileParser]) -> None:
         """Validate extension and parser class, then add to registry.
@@ -82,7 +117,7 @@ class ParserFactory:
 
         # All validation passed, add parser
         self._parsers[extension.lower()] = parser_class
-        logger.debug(f"Added parser {parser_class.__name__} for extension {extension}")
+        logger.debug("Added parser %s for extension %s", parser_class.__name__, extension)
 
     def get_parser(self, file_path: str) -> FileParser:
         """Get appropriate parser instance for the given file.
@@ -96,22 +131,79 @@ class ParserFactory:
         Raises:
             ValueError: If file extension is not supported
         """
-        extension = Path(file_path).suffix.lower()
+        # Inline suffix extraction: building a Path object per call is
+        # pure overhead in batch pipelines. Mirrors Path.suffix semantics
+        # (no suffix for dotless names, dotfiles like '.env', or
+        # trailing-dot names like 'file.').
+        dot = file_path.rfind(".")
+        sep = file_path.rfind("/")
+        extension = file_path[dot:].lower() if sep + 1 < dot < len(file_path) - 1 else ""
 
         if not extension:
-            logger.error(f"File has no extension: {file_path}")
+            logger.error("File has no extension: %s", file_path)
             raise ValueError(f"File has no extension: {file_path}")
 
-        if extension not in self._parsers:
+        parser_class = self._parsers.get(extension)
+        if parser_class is None:
             supported = ", ".join(sorted(self._parsers.keys()))
             error_msg = f"Unsupported file type: {extension}. Supported extensions: {supported}"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-        parser_class = self._parsers[extension]
-        logger.debug(f"Selected {parser_class.__name__} for {extension}")
+        if isinstance(parser_class, str):
+            parser_class = self._resolve_lazy(extension, parser_class)
+
+        parser = self._instances.get(extension)
+        if parser is None:
+            parser = parser_class()
+            self._instances[extension] = parser
+        # Guarded: this runs once per file in batch pipelines, so skip
+        # even the argument-tuple allocation when debug is off.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Selected %s for %s", parser_class.__name__, extension)
 
-        return parser_class()
+        return parser
+
+    def _resolve_lazy(self, extension: str, target: str) -> Type[FileParser]:
+        """Import a lazily registered parser class and cache it.
+
+        Args:
+            extension: Registered extension the class serves
+            target: Import target in "module:Class" form
+
+        Returns:
+            The resolved parser class
+        """
+        module_name, _, class_name = target.partition(":")
+        parser_class: Type[FileParser] = getattr(importlib.import_module(module_name), class_name)
+        self._parsers[extension] = parser_class
+        return parser_class
+
+    async def parse_batch(self, file_paths: list[str]) -> list[str]:
+        """Parse several files concurrently, overlapping reads with parsing.
+
+        File contents are read asynchronously so many loads are in
+        flight at once, while the CPU-bound parsing of already-read
+        buffers runs in worker threads. Results are returned in input
+        order.
+
+        Args:
+            file_paths: Paths to the files to be parsed
+
+        Returns:
+            Extracted text content per file, in input order
+
+        Raises:
+            ValueError: If any file has an unsupported extension or is invalid
+        """
+
+        async def parse_one(file_path: str) -> str:
+            parser = self.get_parser(file_path)
+            async with aiofiles.open(file_path, "rb") as f:
+                data = await f.read()
+            return await asyncio.to_thread(parser.parse_bytes, data)
+
+        return list(await asyncio.gather(*(parse_one(path) for path in file_paths)))
 
     def supported_extensions(self) -> list[str]:
         """Get list of supported file extensions.
@@ -120,3 +212,10 @@ class ParserFactory:
             Sorted list of supported extensions (e.g., ['.doc', '.docx', '.pdf'])
         """
         return sorted(self._parsers.keys())
+
+
+# Shared default-configuration factory, built once at import. Safe to use
+# from multiple threads: the registry is never mutated after construction,
+# and the lazy class/instance caches only ever converge on the same value,
+# so a race costs at most one redundant import or instantiation.
+DEFAULT_FACTORY = ParserFactory.from_trusted()
@@ -1,18 +1,116 @@
-"""PDF file parser."""
+"""PDF file parser.
 
-from pypdf import PdfReader
+Workload note: parsing here is bound by filesystem reads and the
+C-extension page walk, not arithmetic, so the levers that pay off are
+buffered/in-memory reads, a fast C backend (PyMuPDF), and concurrency
+across pages and documents. Vectorization and GPU offload have nothing
+to act on in this module.
+"""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, Union
+
+import pymupdf
+
+from ._textnorm import normalize
 from .base import FileParser
 
+# Below this page count the pool costs more than it saves.
+_PARALLEL_PAGE_THRESHOLD = 4
+
+# Files above this size are streamed from disk instead of being slurped.
+_MAX_IN_MEMORY_BYTES = 100 * 1024 * 1024
+
+
+def _page_text(page: pymupdf.Page) -> str:
+    """Extract plain text from one page."""
+    text: str = page.get_text("text")  # type: ignore[no-untyped-call]
+    return text
+
+
+def _open(source: Union[str, bytes]) -> pymupdf.Document:
+    """Open a document from an in-memory buffer or a filesystem path."""
+    if isinstance(source, bytes):
+        return pymupdf.open(stream=source, filetype="pdf")  # type: ignore[no-untyped-call]
+    return pymupdf.open(source)  # type: ignore[no-untyped-call]
+
 
 class PDFParser(FileParser):
-    """Parser for PDF files using pypdf."""
+    """Parser for PDF files using PyMuPDF."""
+
+    def __init__(self, parallel: bool = True) -> None:
+        """Initialize, optionally disabling parallel page extraction."""
+        self.parallel = parallel
 
     def parse(self, file_path: str) -> str:
         """Extract text from PDF file."""
         try:
-            reader = PdfReader(file_path)
-            text_parts = [page.extract_text() for page in reader.pages if page.extract_text()]
-            return "\n".join(text_parts)
+            return self._parse_source(self._load_source(file_path))
         except Exception as e:
             raise ValueError(f"Failed to parse PDF: {e}") from e
+
+    def iter_pages(self, file_path: str) -> Iterator[str]:
+        """Yield extracted text one page at a time.
+
+        Peak memory stays at a single page's text rather than the whole
+        document, and callers scanning for an early match (contact
+        details are almost always on page one) can stop without paying
+        for the remaining pages.
+        """
+        try:
+            doc = _open(self._load_source(file_path))
+        except Exception as e:
+            raise ValueError(f"Failed to parse PDF: {e}") from e
+        with doc:
+            for page in doc.pages():
+                yield normalize(_page_text(page))
+
+    def parse_bytes(self, data: bytes) -> str:
+        """Extract text from an in-memory PDF buffer."""
+        try:
+            return self._parse_source(data)
+        except Exception as e:
+            raise ValueError(f"Failed to parse PDF: {e}") from e
+
+    @staticmethod
+    def _load_source(file_path: str) -> Union[str, bytes]:
+        """Slurp small files into memory; leave oversized ones on disk.
+
+        One sequential read beats the many small reads the parser would
+        otherwise issue against the file; resumes are small, so the
+        buffer is cheap.
+        """
+        path = Path(file_path)
+        if path.is_file() and path.stat().st_size <= _MAX_IN_MEMORY_BYTES:
+            return path.read_bytes()
+        return file_path
+
+    def _parse_source(self, source: Union[str, bytes]) -> str:
+        """Extract text from a path or an in-memory buffer."""
+        with _open(source) as doc:
+            page_count = doc.page_count
+            if page_count == 0:
+                return ""
+            if self.parallel and page_count >= _PARALLEL_PAGE_THRESHOLD:
+                return normalize(self._parse_parallel(source, page_count))
+            return normalize("\n".join(_page_text(page) for page in doc.pages()))
+
+    @staticmethod
+    def _parse_parallel(source: Union[str, bytes], page_count: int) -> str:
+        """Extract pages across a thread pool and join in page order.
+
+        Text extraction runs in MuPDF's C layer, which releases the GIL,
+        so pages genuinely extract in parallel. Document handles are not
+        thread-safe, so each worker opens its own — against the shared
+        in-memory buffer, that costs no further I/O.
+        """
+
+        def extract_one(index: int) -> str:
+            with _open(source) as doc:
+                return _page_text(doc[index])
+
+        workers = min(os.cpu_count() or 1, page_count)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return "\n".join(pool.map(extract_one, range(page_count)))
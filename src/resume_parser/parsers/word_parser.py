@@ -1,9 +1,20 @@
 """Word document parser."""
 
+import io
+from typing import Any
+
 from docx import Document
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
 
+from ._textnorm import normalize
 from .base import FileParser
 
+# Body-level element tags, resolved once. Dispatching on the tag string
+# avoids two isinstance probes against lxml proxy types per body child.
+_P_TAG = qn("w:p")
+_TBL_TAG = qn("w:tbl")
+
 
 class WordParser(FileParser):
     """Parser for Word documents using python-docx."""
@@ -12,6 +23,51 @@ class WordParser(FileParser):
         """Extract text from Word document."""
         try:
             doc = Document(file_path)
-            return "\n".join([para.text for para in doc.paragraphs if para.text.strip()])
+            return self._extract_text(doc)
+        except Exception as e:
+            raise ValueError(f"Failed to parse Word document: {e}") from e
+
+    def parse_bytes(self, data: bytes) -> str:
+        """Extract text from an in-memory Word document buffer."""
+        try:
+            doc = Document(io.BytesIO(data))
+            return self._extract_text(doc)
         except Exception as e:
             raise ValueError(f"Failed to parse Word document: {e}") from e
+
+    def _extract_text(self, doc: Any) -> str:
+        """Walk the document body in order, keeping paragraphs and tables.
+
+        Walking ``body`` directly preserves the interleaving of
+        paragraphs and tables (``doc.paragraphs`` drops tables
+        entirely) and dispatches each child on its tag string.
+        """
+        body = doc.element.body
+        parts = []
+        for element in body.iterchildren():
+            tag = element.tag
+            if tag == _P_TAG:
+                text = Paragraph(element, body).text
+                if text.strip():
+                    parts.append(text)
+            elif tag == _TBL_TAG:
+                text = self._extract_table_text(element)
+                if text:
+                    parts.append(text)
+        return normalize("\n".join(parts))
+
+    @staticmethod
+    def _extract_table_text(tbl: Any) -> str:
+        """Extract cell text from a table element, one row per line.
+
+        Rows and cells are pulled with XPath against the raw ``w:tbl``
+        element; python-docx's row/cell proxies re-walk the XML tree on
+        every ``.cells`` access, which makes wide tables quadratic.
+        """
+        rows = []
+        for tr in tbl.xpath("./w:tr"):
+            cells = ["".join(tc.xpath(".//w:t/text()")).strip() for tc in tr.xpath("./w:tc")]
+            line = " | ".join(cell for cell in cells if cell)
+            if line:
+                rows.append(line)
+        return "\n".join(rows)
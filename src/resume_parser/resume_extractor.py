@@ -1,7 +1,32 @@
-"""Coordinator for extracting resume fields."""
+"""Coordinator for extracting resume fields.
 
-from .extractors import FieldExtractor
-from .models import ResumeData
+Workload note: orchestration cost is Python object churn plus waiting
+on extractor backends (NER inference, LLM round-trips), not arithmetic.
+Optimizations that pay off here are single-pass shared text views,
+result caching, precomputed dispatch, and concurrency across fields and
+documents; SIMD/GPU-style data parallelism does not apply.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any, Optional
+
+from .extractors import FieldExtractor, ResumeBuffers
+from .models import ResumeBatch, ResumeData
+
+logger = logging.getLogger(__name__)
+
+_RESULT_CACHE_MAX = 1024
+
+# Fields ResumeData carries. A module-level tuple keeps the membership
+# check allocation-free for pipelines that build an extractor per
+# request; missing fields are legal (they fall back to defaults), so
+# this only informs, never raises.
+_REQUIRED_FIELDS = ("name", "email", "skills")
 
 
 class ResumeExtractor:
@@ -10,22 +35,173 @@ class ResumeExtractor:
     def __init__(self, extractors: dict[str, FieldExtractor]) -> None:
         """Initialize with field extractors."""
         self.extractors = extractors
+        missing = [f for f in _REQUIRED_FIELDS if f not in extractors]
+        if missing:
+            logger.debug("No extractor registered for: %s", ", ".join(missing))
+        # Extraction results keyed by text digest: identical resume text
+        # (retries, duplicate submissions) skips the spaCy/LLM chain.
+        self._result_cache: "OrderedDict[bytes, ResumeData]" = OrderedDict()
+        # One worker per extractor: the skills extractor blocks on an
+        # HTTP round-trip and the name extractor on NER inference, so
+        # dispatching them together bounds wall time by the slowest
+        # field instead of the sum.
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, len(extractors)),
+            thread_name_prefix="extract",
+        )
+        # Per-field dispatch plan, frozen at construction: field name,
+        # extractor, and the factory for that field's failure default.
+        # The hot paths walk this tuple instead of re-iterating the dict
+        # and string-comparing field names on every call.
+        self._plan = tuple(
+            (field_name, extractor, list if field_name == "skills" else str)
+            for field_name, extractor in extractors.items()
+        )
+
+    @staticmethod
+    def _text_key(text: str) -> bytes:
+        """Digest resume text into a compact cache key."""
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[ResumeData]:
+        """Return a defensive copy of a cached result, if any."""
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        self._result_cache.move_to_end(key)
+        return replace(cached, skills=list(cached.skills))
+
+    def _cache_put(self, key: bytes, data: ResumeData) -> None:
+        """Store a private copy of a result, evicting the oldest entry."""
+        self._result_cache[key] = replace(data, skills=list(data.skills))
+        if len(self._result_cache) > _RESULT_CACHE_MAX:
+            self._result_cache.popitem(last=False)
 
     def extract(self, text: str) -> ResumeData:
         """Extract all fields from resume text."""
         if not text.strip():
             raise ValueError("Text cannot be empty")
 
+        key = self._text_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        # Build shared text views once; extractors reuse them instead of
+        # each re-scanning or re-case-folding the full text.
+        buffers = ResumeBuffers.from_text(text)
+
+        futures = [
+            (field_name, default, self._pool.submit(extractor.extract_from, buffers))
+            for field_name, extractor, default in self._plan
+        ]
+
         results = {}
-        for field_name, extractor in self.extractors.items():
+        failed = False
+        for field_name, default, future in futures:
             try:
-                results[field_name] = extractor.extract(text)
+                results[field_name] = future.result()
             except Exception:
                 # Use defaults on failure
-                results[field_name] = [] if field_name == "skills" else ""
+                failed = True
+                results[field_name] = default()
+
+        data = ResumeData(
+            name=results.get("name", ""),
+            email=results.get("email", ""),
+            skills=results.get("skills", []),
+        )
+        # Only complete results are cached: a transient extractor failure
+        # must stay retryable, not become sticky for this text.
+        if not failed:
+            self._cache_put(key, data)
+        return data
+
+    def extract_batch(self, texts: list[str]) -> ResumeBatch:
+        """Extract all fields from many resumes into a columnar batch.
+
+        Fields are populated column-by-column — every resume's email,
+        then every name, then every skills list — so each extractor's
+        compiled patterns and model weights stay hot across documents
+        instead of being evicted between fields. Extractors exposing an
+        ``extract_many`` batch method (e.g. the spaCy-backed name
+        extractor) process the whole column in one call.
+        """
+        if any(not text.strip() for text in texts):
+            raise ValueError("Text cannot be empty")
+
+        buffers_list = [ResumeBuffers.from_text(text) for text in texts]
+        columns: dict[str, list[Any]] = {}
+        for field_name, extractor, default in self._plan:
+            extract_many = getattr(extractor, "extract_many", None)
+            if extract_many is not None:
+                try:
+                    columns[field_name] = list(extract_many(texts))
+                    continue
+                except Exception:
+                    pass
+            column = []
+            for buffers in buffers_list:
+                try:
+                    column.append(extractor.extract_from(buffers))
+                except Exception:
+                    # Use defaults on failure
+                    column.append(default())
+            columns[field_name] = column
+
+        count = len(texts)
+        return ResumeBatch(
+            names=columns.get("name", [""] * count),
+            emails=columns.get("email", [""] * count),
+            skills=columns.get("skills", [[] for _ in range(count)]),
+        )
+
+    async def extract_async(self, text: str) -> ResumeData:
+        """Extract all fields concurrently without blocking the event loop.
+
+        Extractors exposing an ``extract_async`` coroutine (e.g. the
+        LLM-backed skills extractor) are awaited directly; the rest run
+        in worker threads. Per-field failures fall back to defaults,
+        matching the synchronous path.
+        """
+        if not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        key = self._text_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        buffers = ResumeBuffers.from_text(text)
+
+        async def run_one(extractor: FieldExtractor) -> Any:
+            extract_async = getattr(extractor, "extract_async", None)
+            if extract_async is not None:
+                return await extract_async(text)
+            return await asyncio.to_thread(extractor.extract_from, buffers)
+
+        outcomes = await asyncio.gather(
+            *(run_one(extractor) for _, extractor, _ in self._plan),
+            return_exceptions=True,
+        )
+
+        results: dict[str, Any] = {}
+        failed = False
+        for (field_name, _, default), outcome in zip(self._plan, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                # Use defaults on failure
+                failed = True
+                results[field_name] = default()
+            else:
+                results[field_name] = outcome
 
-        return ResumeData(
+        data = ResumeData(
             name=results.get("name", ""),
             email=results.get("email", ""),
             skills=results.get("skills", []),
         )
+        # Only complete results are cached: a transient extractor failure
+        # must stay retryable, not become sticky for this text.
+        if not failed:
+            self._cache_put(key, data)
+        return data
@@ -1,16 +1,26 @@
 """Basic tests for framework."""
 
+import re
+
 import pytest
 
 from resume_parser import ResumeParserFramework
 
+# Compiled once; pytest.raises(match=...) accepts a pattern object.
+_ERR_PARSE_FAILED = re.compile(r"Failed to parse")
+
+
+@pytest.fixture(scope="module")
+def framework():
+    """One framework per module; these tests never mutate it, and
+    construction loads the spaCy model."""
+    return ResumeParserFramework()
+
 
 class TestResumeParserFramework:
-    def test_initialization(self):
-        framework = ResumeParserFramework()
+    def test_initialization(self, framework):
         assert framework.extractor is not None
 
-    def test_parse_nonexistent_file(self):
-        framework = ResumeParserFramework()
-        with pytest.raises(ValueError):
+    def test_parse_nonexistent_file(self, framework):
+        with pytest.raises(ValueError, match=_ERR_PARSE_FAILED):
             framework.parse_resume("nonexistent.pdf")
@@ -0,0 +1,32 @@
+"""Basic tests for data models."""
+
+import json
+
+from resume_parser.models import ResumeData
+
+# to_json output is deterministic (insertion-ordered dict, indent=2), so
+# comparing the exact string is both stricter and cheaper than a
+# parse-and-compare round trip.
+_EXPECTED_JSON = """\
+{
+  "name": "Alice Brown",
+  "email": "alice@example.com",
+  "skills": [
+    "React",
+    "TypeScript"
+  ]
+}"""
+
+
+class TestResumeData:
+    def test_to_json(self):
+        resume = ResumeData(
+            name="Alice Brown",
+            email="alice@example.com",
+            skills=["React", "TypeScript"],
+        )
+        assert resume.to_json() == _EXPECTED_JSON
+
+    def test_to_dict_round_trip(self):
+        resume = ResumeData(name="Alice Brown", email="alice@example.com", skills=["React"])
+        assert json.loads(resume.to_json()) == resume.to_dict()
@@ -1,19 +1,24 @@
 """Basic tests for parsers."""
 
+import re
+
 import pytest
 
 from resume_parser.parsers import PDFParser, WordParser
 
-
-class TestPDFParser:
-    def test_parse_nonexistent_file(self):
-        parser = PDFParser()
-        with pytest.raises(ValueError):
-            parser.parse("nonexistent.pdf")
+# Compiled once; pytest.raises(match=...) accepts a pattern object.
+_ERR_PARSE_FAILED = re.compile(r"Failed to parse")
 
 
-class TestWordParser:
-    def test_parse_nonexistent_file(self):
-        parser = WordParser()
-        with pytest.raises(ValueError):
-            parser.parse("nonexistent.docx")
+class TestParsers:
+    @pytest.mark.parametrize(
+        ("parser_cls", "file_path"),
+        [
+            (PDFParser, "nonexistent.pdf"),
+            (WordParser, "nonexistent.docx"),
+        ],
+    )
+    def test_parse_nonexistent_file(self, parser_cls, file_path):
+        parser = parser_cls()
+        with pytest.raises(ValueError, match=_ERR_PARSE_FAILED):
+            parser.parse(file_path)
@@ -1,22 +1,53 @@
 """Basic tests for ResumeExtractor."""
 
+import re
+
 import pytest
 
-from resume_parser.extractors import EmailExtractor, NameExtractor
+from resume_parser.extractors import EmailExtractor, NameExtractor, SkillsExtractor
 from resume_parser.resume_extractor import ResumeExtractor
 
+# Compiled once; pytest.raises(match=...) accepts a pattern object.
+_ERR_EMPTY_TEXT = re.compile(r"Text cannot be empty")
+
+
+@pytest.fixture(scope="module")
+def extractors():
+    """Field extractors built once per module; loading the spaCy model
+    per test would dominate the runtime of these read-only cases."""
+    return {"name": NameExtractor(), "email": EmailExtractor()}
+
+
+@pytest.fixture(scope="module")
+def extractor(extractors):
+    """One coordinator shared by the read-only tests."""
+    return ResumeExtractor(extractors)
+
 
 class TestResumeExtractor:
-    def test_extract(self):
-        extractors = {"name": NameExtractor(), "email": EmailExtractor()}
-        extractor = ResumeExtractor(extractors)
+    def test_extract(self, extractor):
         text = "John Doe\njohn@example.com"
         data = extractor.extract(text)
         assert data.name == "John Doe"
         assert data.email == "john@example.com"
 
-    def test_extract_empty_text(self):
-        extractors = {"name": NameExtractor(), "email": EmailExtractor()}
-        extractor = ResumeExtractor(extractors)
-        with pytest.raises(ValueError):
+    def test_extract_empty_text(self, extractor):
+        with pytest.raises(ValueError, match=_ERR_EMPTY_TEXT):
             extractor.extract("")
+
+
+class TestExtractBatch:
+    def test_extract_batch_columns(self):
+        # No API key, so the skills extractor takes the keyword path.
+        extractors = {"email": EmailExtractor(), "skills": SkillsExtractor()}
+        extractor = ResumeExtractor(extractors)
+        batch = extractor.extract_batch(["a@example.com\nPython and Docker", "b@example.com\nAWS"])
+        assert len(batch) == 2
+        assert batch.emails == ["a@example.com", "b@example.com"]
+        assert batch.skills == [["Docker", "Python"], ["AWS"]]
+        assert batch.row(1).email == "b@example.com"
+
+    def test_skills_extractor_batch_alias(self):
+        # The coordinator dispatches columns through extract_many; the
+        # skills extractor must expose its batch method under that name.
+        assert SkillsExtractor.extract_many is SkillsExtractor.extract_batch